@@ -1,3 +1,4 @@
+from functools import lru_cache
 from ..data import Data, ic, cdt, cst, choices, ut
 from ... import enums as enu
 from .. import events as ev
@@ -70,16 +71,22 @@ class OpeningBody(DataDynamic):
     A_ELEMENTS = DataDynamic.get_attr_element(2).get_change(data_type=cdt.Unsigned),
 
 
+@lru_cache(maxsize=16)
+def _get_seal_report(value: int) -> str:
+    """Translated seal report; depends only on the 4 lower bits of value, so caching by them is exact."""
+    def get_name(value: int):
+        """ СПОДЭСv.3 Е.12.5"""
+        match value & 0b11:
+            case 0: return "$undefined$"
+            case 1: return "$contentions$"
+            case 2: return "$breaked_open$"
+            case 3: return "$subsequent_autopsy$"
+    return get_message(F"$electronic_seals$: $for_cover$ - {get_name(value & 0b11)}, $for_terminals_cover$ - {get_name((value >> 2) & 0b11)}")
+
+
 class SealUnsigned(cdt.Unsigned):
     def get_report(self, with_unit: bool = True) -> str:
-        def get_name(value: int):
-            """ СПОДЭСv.3 Е.12.5"""
-            match value & 0b11:
-                case 0: return "$undefined$"
-                case 1: return "$contentions$"
-                case 2: return "$breaked_open$"
-                case 3: return "$subsequent_autopsy$"
-        return get_message(F"$electronic_seals$: $for_cover$ - {get_name(int(self) & 0b11)}, $for_terminals_cover$ - {get_name((int(self) >> 2) & 0b11)}")
+        return _get_seal_report(int(self) & 0b1111)
 
 
 class SealStatus(DataDynamic):
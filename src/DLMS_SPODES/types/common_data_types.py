@@ -1,12 +1,15 @@
 from itertools import chain
 from dataclasses import dataclass
-from struct import pack, unpack
+from struct import pack, Struct
 from abc import ABC, abstractmethod
 from typing import Type, Any, Callable, TypeAlias, Self
 from collections import deque
+from functools import lru_cache
+from weakref import WeakValueDictionary
 from math import log, ceil
 import datetime
 import logging
+import re
 from ..config_parser import config
 from .. import config_parser
 
@@ -14,6 +17,23 @@ from .. import config_parser
 logger = logging.getLogger(__name__)
 logger.level = logging.INFO
 
+_date_struct = Struct("> H B B B")
+""" year, month, day of month, day of week """
+_datetime_struct = Struct("> H B B B B B B B H")
+""" year, month, day of month, day of week, hour, minute, second, hundredths, deviation """
+_time_struct = Struct("> B B B B")
+""" hour, minute, second, hundredths """
+_long_struct = Struct(">h")
+""" signed year in Date or deviation in DateTime """
+_octet_print_table = bytes(i if i > 32 else 63 for i in range(256))
+""" replace control symbols and space to '?' """
+_visible_print_table = bytes(i if i >= 32 else 63 for i in range(256))
+""" replace control symbols to '?' """
+_not_specified_table = bytes(i if i != 0xff else 0 for i in range(256))
+""" replace NOT SPECIFIED(0xff) to 0 """
+_full_time_pattern = re.compile(r"([0-9]{1,2}):([0-9]{1,2}):([0-9]{1,2})(?:\.([0-9]{1,2}))?")
+""" H:M:S or H:M:S.f with all specified fields, fast path of Time.strptime """
+
 
 # TODO: rewrite with Cython
 def separate(value: str, pattern: str, max_sep: int) -> tuple[str, list[str]]:
@@ -57,6 +77,22 @@ def encode_length(length: int) -> bytes:
         return pack('B', 0x80 + amount) + length.to_bytes(amount, byteorder='big')
 
 
+@lru_cache(maxsize=1024)
+def pack_bits(value: str) -> bytes:
+    """ convert string of '0' and '1' to bytes, last byte padding by zeros. Use in BitString. Cached, result is immutable """
+    if len(value) == 0:
+        return b''
+    if value.strip('01'):
+        raise ValueError(F"got not binary symbols in {value}")
+    pad = (8 - len(value)) % 8
+    return (int(value, base=2) << pad).to_bytes((len(value) + pad) >> 3, 'big')
+
+
+def unpack_bits(value: bytes, length: int) -> str:
+    """ convert bytes to string of '0' and '1' with length. Inverse of pack_bits """
+    return format(int.from_bytes(value, 'big'), F'0{len(value) << 3}b')[:length]
+
+
 def get_length_and_pdu(input_pdu: bytes) -> tuple[int, bytes]:
     """ return Tuple[length, pdu] from value by decoding according to 8.1.3 Length octets ITU-T Rec. X.690 (07/2002) """
     content_start: int = 1
@@ -198,6 +234,13 @@ def get_type_name(value: CommonDataType | Type[CommonDataType]) -> str:
     """type name from type or instance of CDT with length and constant value"""
     if isinstance(value, CommonDataType):
         value = value.__class__
+    if (ret := value.__dict__.get("_type_name")) is None:
+        value._type_name = ret = _get_type_name(value)
+    return ret
+
+
+def _get_type_name(value: Type[CommonDataType]) -> str:
+    """type name by class. Result keep in class as _type_name, class attributes not changed after creation"""
     ret = F"{value.TAG}"
     if value.SIZE is not None:
         ret += F"[{value.SIZE}]"
@@ -210,10 +253,9 @@ def get_type_name(value: CommonDataType | Type[CommonDataType]) -> str:
 
 def get_common_data_type_from(tag: bytes) -> Type[CommonDataType]:
     """ search and get class from tag if existed """
-    try:
-        return __types[tag[:1]]
-    except KeyError:
-        raise ValueError(F'type with tag:{tag[:1]} is absence in Common Data Type')
+    if len(tag) != 0 and (type_ := __types_by_tag[tag[0]]) is not None:
+        return type_
+    raise ValueError(F'type with tag:{tag[:1]} is absence in Common Data Type')
 
 
 def get_instance_and_pdu(meta: Type[CommonDataType], value: bytes) -> tuple[CommonDataType, bytes]:
@@ -355,12 +397,7 @@ class FlagMixin(ABC):
             case _ as bit_error: raise ValueError(F'Unused bit set: {bin(bit_error)}')
 
     def from_str(self, value: str) -> bytes:
-        value = value + '0' * ((8 - len(self)) % 8)
-        list_ = [value[count:(count + 8)] for count in range(0, len(self), 8)]
-        value = b''
-        for byte in list_:
-            value += int(byte, base=2).to_bytes(1, byteorder='little')
-        return value
+        return pack_bits(value.zfill(len(self))[:len(self)])
 
     def from_none(self) -> bytes:
         """because differ from Enum ELEMENT keys"""
@@ -368,10 +405,7 @@ class FlagMixin(ABC):
 
     def decode(self) -> list[int]:
         """ TODO: copypast BitString """
-        ret = list()
-        for byte_ in self.contents:
-            ret.extend([(byte_ >> it) & 0b00000001 for it in range(7, -1, -1)])
-        return ret[:len(self)]
+        return list(map(int, str(self)))
 
     def __len__(self):
         """ return bits amount """
@@ -379,7 +413,7 @@ class FlagMixin(ABC):
 
     def __str__(self):
         """ TODO: copypast BitString """
-        return ''.join(map(str, self.decode()))
+        return unpack_bits(self.contents, len(self))
 
     def validate_from(self, value: str, cursor_position=None):
         """ return 'Ok' if string is valid else return valid Str. TODO: copypast BitString """
@@ -658,7 +692,8 @@ class LIST(ABC):
 
 
 class __DateTime(ABC):
-    __len__: int
+    LENGTH: int
+    """ contents length, define in subclasses """
     _separators: tuple[str]
     contents: bytes
     TAG: TAG
@@ -668,10 +703,10 @@ class __DateTime(ABC):
             case bytes():
                 length_and_contents = value[1:]
                 match value[:1]:
-                    case self.TAG if len(self) <= len(length_and_contents):
-                        self.contents = length_and_contents[:len(self)]
+                    case self.TAG if self.LENGTH <= len(length_and_contents):
+                        self.contents = length_and_contents[:self.LENGTH]
                     case self.TAG:
-                        raise ValueError(F"length of contents for {self.TAG} must be at least {len(self)}, but got {len(length_and_contents)}")
+                        raise ValueError(F"length of contents for {self.TAG} must be at least {self.LENGTH}, but got {len(length_and_contents)}")
                     case _ as wrong_tag:
                         raise ValueError(F"got {TAG(wrong_tag)}, expected {self.TAG} type")
             case None:                                                                 self.clear()
@@ -726,14 +761,67 @@ class __DateTime(ABC):
             except IndexError:
                 raise ValueError
 
-    @abstractmethod
-    def DEFAULT(self):
-        """"""
+    DEFAULT: bytes
+    """ contents by default, define in subclasses """
 
     def clear(self):
         self.contents = self.DEFAULT
 
 
+def _year_from_str(value: str) -> tuple[int, int]:
+    """ year high_byte, year low_byte from string. Use in Date.strpdate """
+    match value:
+        case '' | '_' | '__' | '___' | '____':              return 0xff, 0xff
+        case _ if value.isdigit() and len(value) <= 2:      return divmod(int(value) + 2000, 0x100)
+        case _ if value.isdigit() and len(value) <= 4:      return divmod(int(value), 0x100)
+        case _:                                             raise ValueError(F'Got wrong year={value}')
+
+
+def _month_from_str(value: str) -> int:
+    """ month from string. Use in Date.strpdate """
+    match value:
+        case '' | '_' | '__':                                return 0xff
+        case _ if value.isdigit() and 1 <= int(value) <= 12: return int(value)
+        case 'begin':                                        return 0xfe
+        case 'end':                                          return 0xfd
+        case _:                                              raise ValueError(F'Got wrong month={value}')
+
+
+def _monthday_from_str(value: str) -> int:
+    """ day of month from string. Use in Date.strpdate """
+    match value:
+        case '' | '_' | '__':                                return 0xff
+        case _ if value.isdigit() and 1 <= int(value) <= 31: return int(value)
+        case 'last':                                         return 0xfe
+        case 'penult':                                       return 0xfd
+        case _:                                              raise ValueError(F'Got wrong monthday={value}')
+
+
+_weekdays: dict[str, int] = {name: number for number, names in enumerate((
+    ('1', 'по', 'пон', 'понедельник', 'mo', 'mon', 'monday'),
+    ('2', 'вт', 'вто', 'вторник', 'tu', 'tue', 'tuesday'),
+    ('3', 'ср', 'сре', 'среда', 'we', 'wed', 'wednesday'),
+    ('4', 'чт', 'чет', 'четверг', 'th', 'thu', 'thursday'),
+    ('5', 'пт', 'пят', 'пятница', 'fr', 'fri', 'friday'),
+    ('6', 'сб', 'суб', 'суббота', 'sa', 'sat', 'saturday'),
+    ('7', 'вс', 'вос', 'воскресенье', 'su', 'sun', 'sunday')), start=1) for name in names}
+""" weekday number by lower name """
+_weekday_prefixes: frozenset[str] = frozenset(pat[:i] for pat in (
+    'понедельни', 'вторни', 'сред', 'четвер', 'пятниц', 'суббот', 'воскресень',
+    'monda', 'tuesda', 'wednesda', 'thursda', 'frida', 'saturda', 'sunda') for i in range(1, len(pat) + 1))
+""" uncompleted weekday names """
+
+
+def _weekday_from_str(value: str) -> int:
+    """ day of week from string. Use in Date.strpdate """
+    match value.lower():
+        case '' | '_' | '__':                               return 0xff
+        case _ if value.isdigit() and 1 <= int(value) <= 7: return int(value)
+        case lower if lower in _weekdays:                   return _weekdays[lower]
+        case _ if value in _weekday_prefixes:               return 0xff
+        case _:                                             raise ValueError(F'Got wrong weekday={value}')
+
+
 class __Date(ABC):
     """ years, month, day setters/getters for Date and DateTime """
     TAG: TAG
@@ -813,13 +901,12 @@ class __Date(ABC):
     def check_date(value: bytes):
         if len(value) != 5:
             raise ValueError(F'In the Date type expected length 5, but got {len(value)}')
-        year_highbyte, year_lowbyte, month, day_of_month, day_of_week = \
-            value[0:2].replace(b'\xff\xff', b'\x01\x00') + \
-            value[2:4].replace(b'\xff', b'\x01').replace(b'\xfe', b'\x01').replace(b'\xfd', b'\x01') + \
-            value[4:5].replace(b'\xff', b'\x01')
-        if datetime.date(year_highbyte * 256 + year_lowbyte, month, day_of_month).weekday() != \
-                day_of_week - 1 and value[4:] != b'\xff' and value[0:2] != b'\xff\xff' and \
-                value[2:3] not in b'\xfd\xfe\xff' and value[2:3] not in b'\xfd\xfe\xff':
+        year, month, day_of_month, day_of_week = _date_struct.unpack(value)
+        # 0xffff year replaced by 256, 0xfd..0xff month and day by 1 only for check
+        if datetime.date(0x100 if year == 0xffff else year,
+                         1 if month >= 0xfd else month,
+                         1 if day_of_month >= 0xfd else day_of_month).weekday() != day_of_week - 1 \
+                and day_of_week != 0xff and year != 0xffff and month < 0xfd:
             raise ValueError('Error init Data: week day wrong')
 
     @property
@@ -845,7 +932,7 @@ class __Date(ABC):
             case 7:    weekday = '-вос'
             case 0xff: weekday = ''
             case value: raise ValueError(F'Got weekday={value}, expected 1..7, ff')
-        match unpack('>h', self.contents[:2])[0]:
+        match _long_struct.unpack_from(self.contents)[0]:
             case -1 if weekday == '': year = ''
             case -1:                  year = '.____'
             case value:               year = F'.{str(value).zfill(4)}'
@@ -854,70 +941,58 @@ class __Date(ABC):
     @staticmethod
     def strpdate(value: str) -> bytes | tuple[bytes, str]:
         """ typecasting string to DLMS Date. Where: Y - year, m - month, d - month day, w - weekday """
-        def from_year() -> tuple[int, int]:
-            nonlocal Y
-            match Y:
-                case '' | '_' | '__' | '___' | '____':      return 0xff, 0xff
-                case _ as y if y.isdigit() and len(y) <= 2: return divmod(int(y) + 2000, 0x100)
-                case _ if Y.isdigit() and len(Y) <= 4:      return divmod(int(Y), 0x100)
-                case _:                                     raise ValueError(F'Got wrong year={Y}')
-
-        def from_month() -> int:
-            nonlocal m
-            match m:
-                case '' | '_' | '__':                        return 0xff
-                case _ if m.isdigit() and 1 <= int(m) <= 12: return int(m)
-                case 'begin':                                return 0xfe
-                case 'end':                                  return 0xfd
-                case _:                                      raise ValueError(F'Got wrong month={m}')
-
-        def from_monthday() -> int:
-            nonlocal d
-            match d:
-                case '' | '_' | '__':                        return 0xff
-                case _ if d.isdigit() and 1 <= int(d) <= 31: return int(d)
-                case 'last':                                 return 0xfe
-                case 'penult':                               return 0xfd
-                case _:                                      raise ValueError(F'Got wrong monthday={d}')
-
-        def from_weekday() -> int:
-            nonlocal w
-            match w.lower():
-                case '' | '_' | '__':                                                                          return 0xff
-                case _ if w.isdigit() and 1 <= int(w) <= 7:                                                    return int(w)
-                case '1' | 'по' | 'пон' | 'понедельник' | 'mo' | 'mon' | 'monday':                             return 1
-                case '2' | 'вт' | 'вто' | 'вторник' | 'tu' | 'tue' | 'tuesday':                                return 2
-                case '3' | 'ср' | 'сре' | 'среда' | 'we' | 'wed' | 'wednesday':                                return 3
-                case '4' | 'чт' | 'чет' | 'четверг' | 'th' | 'thu' | 'thursday':                               return 4
-                case '5' | 'пт' | 'пят' | 'пятница' | 'fr' | 'fri' | 'friday':                                 return 5
-                case '6' | 'сб' | 'суб' | 'суббота' | 'sa' | 'sat' | 'saturday':                               return 6
-                case '7' | 'вс' | 'вос' | 'воскресенье' | 'su' | 'sun' | 'sunday' | '':                        return 7
-                case _ if any(map(lambda pat: pat.startswith(w),
-                                  ('понедельни', 'вторни', 'сред', 'четвер', 'пятниц', 'суббот', 'воскресень',
-                                   'monda', 'tuesda', 'wednesda', 'thursda','frida','saturda', 'sunda'))):     return 0xff
-                case _:                                                                                        raise ValueError(F'Got wrong weekday={w}')
-
         match separate(value, '.-', 3):
-            case _,      (d,) if d.isdigit(): return bytes((0xff, 0xff,   0xff,         from_monthday(), 0xff))
-            case _,      (w,):                return bytes((0xff, 0xff,   0xff,         0xff,            from_weekday()))
-            case '.',    (d, m):              return bytes((0xff, 0xff,   from_month(), from_monthday(), 0xff))
-            case '..',   (d, m, Y):           return bytes((*from_year(), from_month(), from_monthday(), 0xff))
-            case '.-',   (d, m, w):           return bytes((0xff, 0xff,   from_month(), from_monthday(), from_weekday()))
-            case '-.',   (w, d, m):           return bytes((0xff, 0xff,   from_month(), from_monthday(), from_weekday()))
-            case '..-',  (d, m, Y, w):        return bytes((*from_year(), from_month(), from_monthday(), from_weekday()))
-            case '-..',  (w, d, m, Y):        return bytes((*from_year(), from_month(), from_monthday(), from_weekday()))
+            case _,      (d,) if d.isdigit(): return bytes((0xff, 0xff,        0xff,               _monthday_from_str(d), 0xff))
+            case _,      (w,):                return bytes((0xff, 0xff,        0xff,               0xff,                  _weekday_from_str(w)))
+            case '.',    (d, m):              return bytes((0xff, 0xff,        _month_from_str(m), _monthday_from_str(d), 0xff))
+            case '..',   (d, m, Y):           return bytes((*_year_from_str(Y), _month_from_str(m), _monthday_from_str(d), 0xff))
+            case '.-',   (d, m, w):           return bytes((0xff, 0xff,        _month_from_str(m), _monthday_from_str(d), _weekday_from_str(w)))
+            case '-.',   (w, d, m):           return bytes((0xff, 0xff,        _month_from_str(m), _monthday_from_str(d), _weekday_from_str(w)))
+            case '..-',  (d, m, Y, w):        return bytes((*_year_from_str(Y), _month_from_str(m), _monthday_from_str(d), _weekday_from_str(w)))
+            case '-..',  (w, d, m, Y):        return bytes((*_year_from_str(Y), _month_from_str(m), _monthday_from_str(d), _weekday_from_str(w)))
             case _ as separate_result:        raise ValueError(F'Unknown date format: separators=<{separate_result[0]}>, values={", ".join(separate_result[1])}')
 
 
+_time_steps = (1, 1, 1, 10_000)
+""" decrement of hour, minute, second, microsecond for search in left """
+_time_max = (23, 59, 59, 990_000)
+""" greatest hour, minute, second, microsecond """
+
+
+def _get_left_nearest_time_fields(fields: tuple[int | None, ...], bound: tuple[int, ...] | None) -> tuple[int, ...] | None:
+    """ return greatest (hour, minute, second, microsecond) not more than bound or None. Field with None is not specified. Without bound return greatest """
+    prefix: tuple[int, ...] = ()
+    """ fields equal with bound and decreased one """
+    if bound is not None:
+        back = None
+        """ index of last not specified field, possible for decrease """
+        for i, (field, limit) in enumerate(zip(fields, bound)):
+            if field is None:
+                if limit >= _time_steps[i]:
+                    back = i
+            elif field < limit:
+                prefix = bound[:i]
+                break
+            elif field > limit:
+                if back is None:
+                    return None
+                prefix = bound[:back] + (bound[back] - _time_steps[back],)
+                break
+        else:
+            return tuple(bound)
+    return prefix + tuple(max_ if field is None else field for field, max_ in zip(fields[len(prefix):], _time_max[len(prefix):]))
+
+
 class __Time(ABC):
     """ hour, minute, second, hundredths setters/getters for Time and DateTime """
     contents: bytes
     TAG: TAG
+    LENGTH: int
 
     @property
     def __contents_offset(self) -> int:
         """ return offset if type is DateTime """
-        return 0 if len(self) == 4 else 5
+        return 0 if self.LENGTH == 4 else 5
 
     def set_hour(self, value: int):
         """ set hour """
@@ -1002,6 +1077,14 @@ class __Time(ABC):
     @staticmethod
     def strptime(value: str) -> bytes:
         """ typecasting string to DLMS Time. Where: H - hour, M - minute, S - second, f - hundredths """
+        if (
+            (m := _full_time_pattern.fullmatch(value))
+            and (h := int(m[1])) <= 23
+            and (mi := int(m[2])) <= 59
+            and (sec := int(m[3])) <= 59
+        ):
+            return bytes((h, mi, sec, 0xff if m[4] is None else int(m[4])))
+
         def from_hour() -> int:
             nonlocal H
             match H:
@@ -1148,8 +1231,13 @@ class Array(__Array, ComplexDataType):
             self.set_type(new_array[0].__class__)
         else:
             """TYPE already initiated"""
-        for el in new_array:
-            self.append(self.TYPE(el))
+        if isinstance(value, bytes):
+            """elements decoded just now and not shared, append without second decoding"""
+            for el in new_array:
+                self.append(el)
+        else:
+            for el in new_array:
+                self.append(self.TYPE(el))
         if hasattr(self, 'cb_post_set'):
             self.cb_post_set()
 
@@ -1169,12 +1257,33 @@ class StructElement:
             return self.NAME
 
 
+_struct_elements: WeakValueDictionary[tuple[str, Type[CommonDataType]], StructElement] = WeakValueDictionary()
+""" shared StructElement by (NAME, TYPE) for all Structures. Entry lives while any Structure(class or nonename instance) keeps the element in ELEMENTS,
+after that it removed with key, so TYPE of Structures created at runtime is not held """
+
+
+def _get_struct_element(name: str, type_: Type[CommonDataType]) -> StructElement:
+    """return StructElement from common container, create if absence"""
+    if (el := _struct_elements.get(key := (name, type_))) is None:
+        el = _struct_elements.setdefault(key, StructElement(name, type_))
+    return el
+
+
+def _copy_simple(value: SimpleDataType) -> SimpleDataType:
+    """ fast copy of SimpleDataType without decoding. Contents is immutable, that is why copy of attributes is enough """
+    new = object.__new__(value.__class__)
+    new.__dict__.update(value.__dict__)
+    return new
+
+
 class Structure(ComplexDataType):
     """ The elements of the structure are defined in the Attribute or Method description section of a COSEM IC specification """
     TAG = TAG(b'\x02')
     ELEMENTS: tuple[StructElement, ...]
     values: list[CommonDataType, ...]
     DEFAULT: bytes = None
+    _fixed_layout: tuple[Struct, tuple[TAG, ...]] | None = None
+    """ for ELEMENTS with fixed length only: unpacker of contents and elements tags """
 
     def __init__(self, value: bytes | tuple | list | None | bytearray | Self = None):
         if value is None:
@@ -1184,8 +1293,8 @@ class Structure(ComplexDataType):
             case bytes():                  self.from_bytes(value)
             case tuple() | list():         self.from_sequence(value)
             case None:
-                for el in self.ELEMENTS:
-                    self.values.append(el.TYPE())
+                for el, default in zip(self.ELEMENTS, self.__get_defaults()):
+                    self.values.append(el.TYPE() if default is None else _copy_simple(default))
             case bytearray():              self.from_content(bytes(value))
             case Structure():              self.from_content(value.contents)
             # case Structure():              self.__from_sequence(value)
@@ -1240,18 +1349,37 @@ class Structure(ComplexDataType):
                 for k in kwargs.keys():
                     for i, el in enumerate(cls.ELEMENTS):
                         if k == el.NAME:
-                            elements[i] = StructElement(el.NAME, kwargs[k])
+                            elements[i] = _get_struct_element(el.NAME, kwargs[k])
                 cls.ELEMENTS = tuple(elements)
         else:
             elements = list()
             for (name, type_), f in zip(cls.__annotations__.items(), (
                     Structure.get_el0, Structure.get_el1, Structure.get_el2, Structure.get_el3, Structure.get_el4, Structure.get_el5, Structure.get_el6, Structure.get_el7,
                     Structure.get_el8, Structure.get_el9)):
-                elements.append((StructElement(
-                    NAME=name,
-                    TYPE=type_)))
+                elements.append(_get_struct_element(name, type_))
                 setattr(cls, name, f)
             cls.ELEMENTS = tuple(elements)
+        cls._fixed_layout = cls.__get_fixed_layout()
+
+    @classmethod
+    def __get_fixed_layout(cls) -> tuple[Struct, tuple[TAG, ...]] | None:
+        """return unpacker <tag><contents>... if all elements has constant length, else None"""
+        formats = list()
+        for el in cls.ELEMENTS:
+            if isinstance(el.TYPE, type) and issubclass(el.TYPE, Digital) and isinstance(el.TYPE.LENGTH, int):
+                formats.append(F"c{el.TYPE.LENGTH}s")
+            elif isinstance(el.TYPE, type) and issubclass(el.TYPE, Enum):
+                formats.append("c1s")
+            else:
+                return None
+        return Struct(">" + "".join(formats)), tuple(el.TYPE.TAG for el in cls.ELEMENTS)
+
+    @classmethod
+    def __get_defaults(cls) -> tuple[SimpleDataType | None, ...]:
+        """ default values of SimpleDataType elements for copy, None for other elements. Create at first call """
+        if (defaults := cls.__dict__.get("_defaults")) is None:
+            cls._defaults = defaults = tuple(value if isinstance(value := el.TYPE(), SimpleDataType) else None for el in cls.ELEMENTS)
+        return defaults
 
     def from_bytes(self, encoding: bytes):
         tag, length_and_contents = encoding[:1], encoding[1:]
@@ -1261,7 +1389,7 @@ class Structure(ComplexDataType):
         if not hasattr(self, "ELEMENTS"):
             el: list[StructElement] = list()
             for i in range(length):
-                el.append(StructElement(F'#{i}', get_common_data_type_from(pdu[:1])))
+                el.append(_get_struct_element(F'#{i}', get_common_data_type_from(pdu[:1])))
                 el_value, pdu = get_instance_and_pdu(el[i].TYPE, pdu)
                 self.values.append(el_value)
             self.__dict__['ELEMENTS'] = tuple(el)
@@ -1277,6 +1405,12 @@ class Structure(ComplexDataType):
             self.values.append(el.TYPE(val))
 
     def from_content(self, value: bytes):
+        if self._fixed_layout is not None:
+            layout, tags = self._fixed_layout
+            if len(value) >= layout.size and (fields := layout.unpack_from(value))[::2] == tags:
+                for el, contents in zip(self.ELEMENTS, fields[1::2]):
+                    self.values.append(el.TYPE(bytearray(contents)))
+                return
         for el in self.ELEMENTS:
             el_value, value = get_instance_and_pdu(el.TYPE, value)
             self.values.append(el_value)
@@ -1400,6 +1534,10 @@ class AXDR(ABC):
             return super(AXDR, self).contents
 
 
+_false_prefixes = frozenset(word[:i] for word in ('False', 'Ложь', 'No', 'Нет') for i in range(1, len(word) + 1))
+_true_prefixes = frozenset(word[:i] for word in ('True', 'Правда', 'Yes', 'Да') for i in range(1, len(word) + 1))
+
+
 class Boolean(SimpleDataType):
     """ boolean """
     TAG = TAG(b'\x03')
@@ -1433,12 +1571,12 @@ class Boolean(SimpleDataType):
         return b'\x00' if value == 0 else b'\x01'
 
     def from_str(self, value: str) -> bytes:
-        if value == '0' or 'False'.startswith(value.title()) or 'Ложь'.startswith(value.title()) or \
-                'No'.startswith(value.title()) or 'Нет'.startswith(value.title()):
+        if value in ('', '0') or (title := value.title()) in _false_prefixes:  # empty string is False by design
             return b'\x00'
-        elif value == '1' or 'True'.startswith(value.title()) or 'Правда'.startswith(value.title()) or \
-                'Yes'.startswith(value.title()) or 'Да'.startswith(value.title()):
+        elif value == '1' or title in _true_prefixes:
             return b'\x01'
+        else:
+            raise ValueError(F"can't create {self.TAG} with value {value}")
 
     def from_bool(self, value: bool) -> bytes:
         return b'\x01' if value else b'\x00'
@@ -1489,8 +1627,7 @@ class BitString(SimpleDataType):
 
     def from_str(self, value: str) -> bytes:
         self.__length = len(value)
-        value = value + '0' * ((8 - self.__length) % 8)
-        return bytes((int(value[count:(count + 8)], base=2) for count in range(0, self.__length, 8)))
+        return pack_bits(value)
 
     def from_list(self, value: list[int]) -> bytes:
         return self.from_str("".join(map(str, value)))
@@ -1514,25 +1651,26 @@ class BitString(SimpleDataType):
             self.cb_post_set()
 
     def __setitem__(self, key: int, value: int | bool):
-        tmp = self.decode()
-        tmp[key] = int(value)
-        self.set(''.join(map(str, tmp)))
+        mask = self.__get_mask(key)
+        self.__set_int(self.__as_int() | mask if value else self.__as_int() & ~mask)
 
     def inverse(self, index: int):
         """ inverse one bit by index"""
-        self[index] = not self.decode()[index]
+        self.__set_int(self.__as_int() ^ self.__get_mask(index))
 
     def __lshift__(self, other):
-        for i in range(other):
-            tmp: list[int] = self.decode()
-            tmp.append(tmp.pop(0))
-            self.set(''.join(map(str, tmp)))
+        """ cyclic shift to left by <other> bits """
+        if len(self) != 0:
+            other %= len(self)
+            value = self.__as_int()
+            self.__set_int(((value << other) | (value >> (len(self) - other))) & ((1 << len(self)) - 1))
 
     def __rshift__(self, other):
-        for i in range(other):
-            tmp: list[int] = self.decode()
-            tmp.insert(0, tmp.pop())
-            self.set(''.join(map(str, tmp)))
+        """ cyclic shift to right by <other> bits """
+        if len(self) != 0:
+            other %= len(self)
+            value = self.__as_int()
+            self.__set_int(((value >> other) | (value << (len(self) - other))) & ((1 << len(self)) - 1))
 
     def __len__(self):
         return self.__length
@@ -1544,8 +1682,34 @@ class BitString(SimpleDataType):
 
     def clear(self):
         """set all bits as 0"""
-        for i in range(len(self)):
-            self[i] = 0
+        self.__set_int(0)
+
+    def __as_int(self) -> int:
+        """ bits as integer without padding """
+        return int.from_bytes(self.contents, 'big') >> ((len(self.contents) << 3) - len(self))
+
+    def __set_int(self, value: int):
+        """ set bits from integer with current length """
+        pad = (8 - len(self)) % 8
+        self.set(self.TAG + encode_length(len(self)) + (value << pad).to_bytes((len(self) + pad) >> 3, 'big'))
+
+    def __get_mask(self, index: int) -> int:
+        """ return integer mask of bit by index, negative index from end """
+        if not -len(self) <= index < len(self):
+            raise IndexError(F"bit index {index} out of range {len(self)}")
+        return 1 << (len(self) - 1 - index % len(self))
+
+    def popcount(self) -> int:
+        """ return amount of set bits """
+        return self.__as_int().bit_count()
+
+    def any(self) -> bool:
+        """ return True if at least one bit is set """
+        return self.__as_int() != 0
+
+    def all(self) -> bool:
+        """ return True if all bits is set """
+        return self.__as_int() == (1 << len(self)) - 1
 
     @property
     def encoding(self) -> bytes:
@@ -1553,18 +1717,22 @@ class BitString(SimpleDataType):
 
     def __str__(self):
         """ TODO: copypast FlagMixin"""
-        return ''.join(map(str, self.decode()))
+        return unpack_bits(self.contents, len(self))
 
     def __getitem__(self, item) -> bytes:
         """ get bit from contents by index """
-        return int(str(self)[item]).to_bytes(1, 'big')
+        match item:
+            case int() if -len(self) <= item < len(self):
+                item %= len(self)
+                return b'\x01' if self.contents[item >> 3] & (0x80 >> (item & 7)) else b'\x00'
+            case int():
+                raise IndexError(F"bit index {item} out of range {len(self)}")
+            case _:
+                return int(str(self)[item]).to_bytes(1, 'big')
 
     def decode(self) -> list[int]:
         """ TODO: copypast FlagMixin """
-        ret = list()
-        for byte_ in self.contents:
-            ret.extend([(byte_ >> it) & 0b00000001 for it in range(7, -1, -1)])
-        return ret[:len(self)]
+        return list(map(int, str(self)))
 
     def validate_from(self, value: str, cursor_position: int) -> tuple[str, int]:
         """ return validated value and cursor position. TODO: copypast FlagMixin """
@@ -1595,19 +1763,17 @@ class OctetString(_String, SimpleDataType):
         return bytes.fromhex(value)
 
     def from_int(self, value: int) -> bytes:
-        """ Convert with recursion. Maximum convert length is 32 """
-        def to_bytes_with(length_):
-            try:
-                return int.to_bytes(value, length_, 'big')
-            except OverflowError:
-                if length_ > 31:
-                    raise ValueError(F'Value {value} is big to convert to bytes')
-                return to_bytes_with(length_+1)
-        length = 1
-        return to_bytes_with(length)
+        """ Convert with minimal length. Maximum convert length is 32 """
+        length = ((value.bit_length() or 1) + 7) >> 3
+        if value < 0 or length > 32:
+            raise ValueError(F'Value {value} is big to convert to bytes')
+        return value.to_bytes(length, 'big')
 
     def __str__(self):
-        return F"{self.contents.hex(' ')}"
+        """ cached hex while contents is same object """
+        if (cache := self.__dict__.get('_str_cache')) is None or cache[0] is not self.contents:
+            self._str_cache = cache = (self.contents, self.contents.hex(' '))
+        return cache[1]
 
     def __len__(self):
         return len(self.contents)
@@ -1631,10 +1797,7 @@ class OctetString(_String, SimpleDataType):
 
     def to_str(self, encoding: str = 'cp1251') -> str:
         """ decode to cp1251 by default, replace to '?' if unsupported """
-        temp = list()
-        for i in self.contents:
-            temp.append(i if i > 32 else 63)
-        return bytes(temp).decode(encoding)
+        return self.contents.translate(_octet_print_table).decode(encoding)
 
     def __bytes__(self):
         return self.contents
@@ -1645,23 +1808,23 @@ class VisibleString(_String, SimpleDataType):
     TAG = TAG(b'\x0A')
 
     def from_str(self, value: str) -> bytes:
-        return bytes(value, 'cp1251')
+        return value.encode('cp1251')
 
     def from_int(self, value: int) -> bytes:
-        return bytes(str(value), 'cp1251')
+        return str(value).encode('cp1251')
 
     def __str__(self):
-        return bytes([char if char >= 0x20 else 63 for char in self.contents]).decode(encoding='cp1251')
+        """ cached text while contents is same object """
+        if (cache := self.__dict__.get('_str_cache')) is None or cache[0] is not self.contents:
+            self._str_cache = cache = (self.contents, self.contents.translate(_visible_print_table).decode(encoding='cp1251'))
+        return cache[1]
 
     def __len__(self):
         return len(self.contents)
 
     def decode(self, encoding: str = 'cp1251') -> str:
         """ decode to cp1251 by default, replace to '?' if unsupported """
-        temp = list()
-        for i in self.contents:
-            temp.append(i if i >= 32 else 63)
-        return bytes(temp).decode(encoding)
+        return self.contents.translate(_visible_print_table).decode(encoding)
 
     def to_str(self) -> str:
         return self.decode()
@@ -1672,10 +1835,10 @@ class Utf8String(_String, SimpleDataType):
     TAG = TAG(b'\x0c')
 
     def from_str(self, value: str) -> bytes:
-        return bytes(value, "utf-8")
+        return value.encode("utf-8")
 
     def from_int(self, value: int) -> bytes:
-        return bytes(str(value), "utf-8")
+        return str(value).encode("utf-8")
 
     def __str__(self):
         return self.contents.decode("utf-8")
@@ -1724,15 +1887,12 @@ class Bcd(SimpleDataType):
     def contents_length(self) -> int: return 1
 
     def from_str(self, value: str) -> bytes:
-        try:
-            return int(value).to_bytes(1, 'little')
-        except OverflowError:
-            raise ValueError('Value out of range')
+        return self.from_int(int(value))
 
     def from_int(self, value: int) -> bytes:
-        try:
-            return value.to_bytes(1, 'little')
-        except OverflowError:
+        if 0 <= value <= 0xff:
+            return bytes((value,))
+        else:
             raise ValueError(F'value: {value} not in range')
 
     def __str__(self):
@@ -1816,10 +1976,21 @@ class Enum(SimpleDataType, ABC):
     contents: bytes
     TAG = TAG(b'\x16')
     ELEMENTS: dict[bytes, str] = None
+    _default_contents: bytes
+    """first key of ELEMENTS, define in __init_subclass__"""
     __match_args__ = ('value2', )
 
     def __init__(self, value: bytes | bytearray | str | int | Self = None):
-        match value:  # TODO: replace priority case
+        if value.__class__ is bytes and len(value) >= 2 and value[:1] == self.TAG:
+            """ fast path for decoding from PDU """
+            self.contents = value[1:2]
+        else:
+            self.__init_from(value)
+        if self.ELEMENTS is not None:
+            self.validation()
+
+    def __init_from(self, value: bytes | bytearray | str | int | Self):
+        match value:
             case bytes() as encoding:
                 match encoding[:1]:
                     case self.TAG if len(encoding) >= 2:                  self.contents = encoding[1:2]
@@ -1831,8 +2002,6 @@ class Enum(SimpleDataType, ABC):
             case int():                                                   self.contents = self.from_int(value)
             case self.__class__():                                        self.contents = value.contents
             case _:                                                       raise ValueError(F'Unknown type for {self.__class__.__name__} with value {value}<{value.__class__}>')
-        if self.ELEMENTS is not None:
-            self.validation()
 
     def from_int(self, value: int) -> bytes:
         try:
@@ -1852,7 +2021,7 @@ class Enum(SimpleDataType, ABC):
 
     def from_none(self):
         """first key value"""
-        return next(iter(self.ELEMENTS))
+        return self._default_contents
 
     def validation(self):
         """ check value after inited. Maybe override """
@@ -1866,13 +2035,18 @@ class Enum(SimpleDataType, ABC):
     def __init_subclass__(cls, **kwargs):
         """initiate ELEMENTS name use config.toml"""
         if not cls.ELEMENTS:
-            elements: tuple[int, ...] = kwargs["elements"]
+            elements: tuple[int, ...] | range = kwargs["elements"]
             try:
                 c = {par["e"]: par["v"] for par in config["DLMS"][cls.__name__]}
             except KeyError as e:
                 c = dict()
                 logger.warning(F"not find {e} in config.toml")
-            cls.ELEMENTS = {el if issubclass(cls, FlagMixin) else el.to_bytes(1, "big"): c.get(el, F"{cls.__name__}({el})") for el in elements}
+            if issubclass(cls, FlagMixin):
+                cls.ELEMENTS = {el: c.get(el, F"{cls.__name__}({el})") for el in elements}
+            else:
+                cls.ELEMENTS = {bytes((el,)): c.get(el, F"{cls.__name__}({el})") for el in elements}
+        if cls.ELEMENTS and not issubclass(cls, FlagMixin):
+            cls._default_contents = next(iter(cls.ELEMENTS))
 
     @property
     def encoding(self) -> bytes:
@@ -2007,6 +2181,7 @@ class DateTime(__DateTime, __Date, __Time, SimpleDataType):
             e Flag set to true: the transmitted time contains the daylight saving deviation (summer time).
                 Flag set to false: the transmitted time does not contain daylight saving deviation (normal time)."""
     TAG = TAG(b'\x19')
+    LENGTH = 12
     _separators = ('.', '.', '-', ' ', ':', ':', '.', ' ')
 
     def __init__(self, value: datetime.datetime | datetime.date | bytearray | bytes | str = None):
@@ -2014,10 +2189,9 @@ class DateTime(__DateTime, __Date, __Time, SimpleDataType):
         self.check_date(self.contents[0:5])
         self.check_time()
 
-    def __len__(self) -> int: return 12
+    def __len__(self) -> int: return self.LENGTH
 
-    @property
-    def DEFAULT(self): return b'\x07\xe4\x01\x01\xff\x00\x00\x00\x00\x00\xb4\xff'
+    DEFAULT = b'\x07\xe4\x01\x01\xff\x00\x00\x00\x00\x00\xb4\xff'
 
     def from_str(self, value: str) -> bytes:
         def from_deviation() -> bytes:
@@ -2038,24 +2212,24 @@ class DateTime(__DateTime, __Date, __Time, SimpleDataType):
     def from_datetime(self, value: datetime.datetime) -> bytes:
         """ convert from build to DLMS datetime, weekday not set for uniquely datetime """
         match value.utcoffset():
-            case None: deviation = 0x8000
-            case _:    deviation = value.utcoffset().seconds // 60
-        return pack('>HBBBBBBBH',
-                    value.year,
-                    value.month,
-                    value.day,
-                    255,
-                    value.hour,
-                    value.minute,
-                    value.second,
-                    value.microsecond//10_000,
-                    deviation)+b'\xFF'
+            case None:          deviation = 0x8000
+            case _ as offset:   deviation = offset.seconds // 60
+        return _datetime_struct.pack(
+            value.year,
+            value.month,
+            value.day,
+            255,
+            value.hour,
+            value.minute,
+            value.second,
+            value.microsecond//10_000,
+            deviation)+b'\xFF'
 
     def from_date(self, value: datetime.date) -> bytes:
-        return bytes(((value.year >> 8) & 0xFF, value.year & 0xFF, value.month, value.day, value.weekday() + 1)) + b'\xFF\xFF\xFF\xFF\x80\x00\xFF'
+        return _date_struct.pack(value.year, value.month, value.day, value.weekday() + 1) + b'\xFF\xFF\xFF\xFF\x80\x00\xFF'
 
     def from_time(self, value: datetime.time) -> bytes:
-        return b'\xFF\xFF\xFF\xFF\xFF'+bytes((value.hour, value.minute, value.second, value.microsecond // 10_000)) + \
+        return b'\xFF\xFF\xFF\xFF\xFF'+_time_struct.pack(value.hour, value.minute, value.second, value.microsecond // 10_000) + \
                b'\x80\x00\xFF'
 
     def set_clock_status(self, value: str | int):
@@ -2063,7 +2237,7 @@ class DateTime(__DateTime, __Date, __Time, SimpleDataType):
         self.contents = self.contents[:12] + int(value).to_bytes(1, 'big')
 
     def __str__(self):
-        match unpack('>h', self.contents[9:11])[0]:
+        match _long_struct.unpack_from(self.contents, 9)[0]:
             case -0x8000:     deviation = ''
             case _ as value: deviation = str(value)
         return F'{self.strfdate} {self.strftime} {deviation}'
@@ -2072,9 +2246,7 @@ class DateTime(__DateTime, __Date, __Time, SimpleDataType):
         return True if self.contents == b'\xff\xff\xff\xff\xff\xff\xff\xff\xff\x80\x00\xff' else False
 
     def decode(self) -> datetime.datetime:
-        year_highbyte, year_lowbyte, month, day_of_month, _, hour, minute, second, hundredths, deviation_highbyte, deviation_lowbyte, _ = self.contents
-        year = year_highbyte*256+year_lowbyte
-        deviation = deviation_highbyte*256 + deviation_lowbyte
+        year, month, day_of_month, _, hour, minute, second, hundredths, deviation = _datetime_struct.unpack_from(self.contents)
         return datetime.datetime(year=year if year != 0xffff else datetime.MINYEAR,
                                  month=month if month not in {0xff, 0xfe, 0xfd} else 1,
                                  day=day_of_month if day_of_month not in {0xff, 0xfe, 0xfd} else 1,
@@ -2123,26 +2295,16 @@ class DateTime(__DateTime, __Date, __Time, SimpleDataType):
         """ search and return datetime in left from point """
         l_point: datetime.datetime = self.get_left_nearest_date(point)
         """ time in left from point """
-        is_this_day: bool = l_point.date() == point.date()
-        """ flag of points equaling """
         if l_point is None:
             return None
-        for hour in range(point.hour if is_this_day else 23, -1, -1) if self.hour is None else (self.hour,):
-            l_point = l_point.replace(hour=hour)
-            for minute in range(point.minute if is_this_day and l_point.hour == point.hour else 59, -1, -1) if self.minute is None else (self.minute,):
-                l_point = l_point.replace(minute=minute)
-                for second in range(point.second if is_this_day and l_point.hour == point.hour and
-                                    l_point.minute == point.minute else 59, -1, -1) if self.second is None else (self.second,):
-                    l_point = l_point.replace(second=second)
-                    for microsecond in range(point.microsecond if is_this_day and l_point.hour == point.hour and
-                                             l_point.minute == point.minute and
-                                             l_point.second == point.second else 990000, -1, -10000) if self.hundredths is None else (self.hundredths * 10000,):
-                        l_point = l_point.replace(microsecond=microsecond)
-                        if l_point > point:
-                            continue
-                        else:
-                            return l_point
-        return None
+        match _get_left_nearest_time_fields(
+                fields=(self.hour, self.minute, self.second, None if self.hundredths is None else self.hundredths * 10000),
+                bound=(point.hour, point.minute, point.second, point.microsecond) if l_point.date() == point.date() else None):
+            case None:
+                return None
+            case hour, minute, second, microsecond:
+                l_point = l_point.replace(hour=hour, minute=minute, second=second, microsecond=microsecond)
+                return None if l_point > point else l_point
 
 
 class Date(__DateTime, __Date, SimpleDataType):
@@ -2162,29 +2324,28 @@ class Date(__DateTime, __Date, SimpleDataType):
         dayOfWeek: interpreted as unsigned range 1…7, 0xFF 1 is Monday
             0xFF = not specified"""
     TAG = TAG(b'\x1a')
+    LENGTH = 5
     _separators = ('.', '.', '-')
 
     def __init__(self, value: datetime.datetime | datetime.date | bytearray | bytes | str | int = None):
         super(Date, self).__init__(value)
         self.check_date(self.contents)
 
-    @property
-    def DEFAULT(self): return b'\x07\xe4\x01\x01\x03'
+    DEFAULT = b'\x07\xe4\x01\x01\x03'
 
-    def __len__(self) -> int: return 5
+    def __len__(self) -> int: return self.LENGTH
 
     def from_str(self, value: str) -> bytes:
         return self.strpdate(value)
 
     def from_datetime(self, value: datetime.datetime) -> bytes:
-        return bytes(((value.year >> 8) & 0xFF, value.year & 0xFF, value.month, value.day, value.weekday() + 1))
+        return _date_struct.pack(value.year, value.month, value.day, value.weekday() + 1)
 
     def from_date(self, value: datetime.date) -> bytes:
-        return bytes(((value.year >> 8) & 0xFF, value.year & 0xFF, value.month, value.day, value.weekday() + 1))
+        return _date_struct.pack(value.year, value.month, value.day, value.weekday() + 1)
 
     def decode(self) -> datetime.date:
-        year_highbyte, year_lowbyte, month, day_of_month, _ = self.contents
-        year = year_highbyte*256+year_lowbyte
+        year, month, day_of_month, _ = _date_struct.unpack(self.contents)
         return datetime.date(year=year if year != 0xffff else datetime.MINYEAR,
                              month=month if month not in {0xff, 0xfe, 0xfd} else 1,
                              day=day_of_month if day_of_month not in {0xff, 0xfe, 0xfd} else 1)
@@ -2203,73 +2364,61 @@ class Time(__DateTime, __Time, SimpleDataType):
     For hour, minute, second and hundredths: 0xFF = not specified.
     For repetitive times the unused parts shall be set to “not specified”."""
     TAG = TAG(b'\x1b')
+    LENGTH = 4
     _separators = (':', ':', '.')
 
     def __init__(self, value: datetime.datetime | datetime.time | bytearray | bytes | str = None):
         super(Time, self).__init__(value)
         self.check_time()
 
-    def __len__(self) -> int: return 4
+    def __len__(self) -> int: return self.LENGTH
 
-    @property
-    def DEFAULT(self): return b'\x00\x00\x00\x00'
+    DEFAULT = b'\x00\x00\x00\x00'
 
     def from_str(self, value: str) -> bytes:
         return self.strptime(value)
 
     def from_datetime(self, value: datetime.datetime) -> bytes:
-        return bytes((value.hour, value.minute, value.second, value.microsecond // 10_000))
+        return _time_struct.pack(value.hour, value.minute, value.second, value.microsecond // 10_000)
 
     def from_time(self, value: datetime.time) -> bytes:
-        return bytes((value.hour, value.minute, value.second, value.microsecond // 10_000))
+        return _time_struct.pack(value.hour, value.minute, value.second, value.microsecond // 10_000)
 
     def __str__(self):
         return self.strftime
 
     def decode(self) -> datetime.time:
         """ return python time. Used 00 instead 'NOT SPECIFIED'  """
-        hour, minute, second, hundredths = self.contents
-        return datetime.time(hour=hour if hour != 0xff else 0,
-                             minute=minute if minute != 0xff else 0,
-                             second=second if second != 0xff else 0,
-                             microsecond=hundredths*10000 if hundredths != 0xff else 0)
+        hour, minute, second, hundredths = self.contents.translate(_not_specified_table)
+        return datetime.time(hour, minute, second, hundredths * 10000)
 
     def get_left_nearest_time(self, point: datetime.time) -> datetime.time | None:
         """ search and return time in left from point """
-        l_point: datetime.time = self.decode()
-        """ time in left from point """
-        for hour in range(point.hour, -1, -1) if self.hour is None else (self.hour,):
-            l_point = l_point.replace(hour=hour)
-            for minute in range(point.minute if l_point.hour == point.hour else 59, -1, -1) if self.minute is None else (self.minute,):
-                l_point = l_point.replace(minute=minute)
-                for second in range(point.second if l_point.hour == point.hour and
-                                    l_point.minute == point.minute else 59, -1, -1) if self.second is None else (self.second,):
-                    l_point = l_point.replace(second=second)
-                    for microsecond in range(point.microsecond if l_point.hour == point.hour and
-                                             l_point.minute == point.minute and
-                                             l_point.second == point.second else 990000, -1, -10000) if self.hundredths is None else (self.hundredths * 10000,):
-                        l_point = l_point.replace(microsecond=microsecond)
-                        if l_point > point:
-                            continue
-                        else:
-                            return l_point
-        return None
+        match _get_left_nearest_time_fields(
+                fields=(self.hour, self.minute, self.second, None if self.hundredths is None else self.hundredths * 10000),
+                bound=(point.hour, point.minute, point.second, point.microsecond)):
+            case None:
+                return None
+            case hour, minute, second, microsecond:
+                return datetime.time(hour, minute, second, microsecond)
 
 
 __types: dict[bytes, Type[CommonDataType]] = {bytes(dlms_type.TAG): dlms_type for dlms_type in chain(SimpleDataType.__subclasses__(), ComplexDataType.__subclasses__())}
 """ Common data type dictionary """
+__types_by_tag: tuple[Type[CommonDataType] | None, ...] = tuple(__types.get(bytes((tag,))) for tag in range(0x100))
+""" Common data type by tag value, None if absence """
 
 
 CommonDataTypes: TypeAlias = NullData | Array | Structure | Boolean | BitString | DoubleLong | DoubleLongUnsigned | OctetString | VisibleString | Utf8String | Bcd | Integer | \
                              Long | Unsigned | LongUnsigned | CompactArray | Long64 | Long64Unsigned | Enum | Float32 | Float64 | DateTime | Date | Time
 
 
-class Unit(Enum, elements=tuple(range(1, 256))):
-    SCALERS: dict[bytes, int] = {it.to_bytes(1, "big"): 0 for it in range(1, 256)}
-    """castom scaler depend from unit. initiate by 0 all"""
+class Unit(Enum, elements=range(1, 256)):
+    SCALERS: list[int] = [0] * 0x100
+    """castom scaler depend from unit, index is unit value. initiate by 0 all"""
     if unit_table := config_parser.get_values("DLMS", "Unit"):
         for par in unit_table:
-            SCALERS[par["e"].to_bytes()] = par.get("scaler", 0)
+            SCALERS[par["e"]] = par.get("scaler", 0)
         SCALER_NAME = {it["value"]: it["name"] for it in config_parser.get_values("DLMS", "scaler_prefix")}
 
     def __str__(self):
@@ -2282,7 +2431,7 @@ class Unit(Enum, elements=tuple(range(1, 256))):
                     raise ValueError(F"unsupport scaler preset: {other} in Unit")
 
     def get_scaler(self) -> int:
-        return self.SCALERS[self.contents]
+        return self.SCALERS[self.contents[0]]
 
 
 class ScalUnitType(Structure):
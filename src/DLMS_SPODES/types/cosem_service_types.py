@@ -1,8 +1,32 @@
 from typing import Self
+from functools import lru_cache
 from ..types import common_data_types as cdt
 import datetime
 
 
+def _from_group(value: str, empty: bytes) -> bytes:
+    """ one group of logical name from string, <empty> if value is absence """
+    if value == '':
+        return empty
+    try:
+        return int(value).to_bytes(1, 'big')
+    except OverflowError:
+        raise ValueError(F'Int too big to convert {value}')
+
+
+@lru_cache(maxsize=1000)
+def _ln_contents_from_str(value: str) -> bytes:
+    """ LogicalName contents from string with caching, because it's immutable bytes """
+    raw_value = bytes()
+    for empty, separator in zip((b'\x00', )*5+(b'\xff', ), ('.', '.', '.', '.', '.', ' ')):
+        try:
+            element, value = value.split(separator, 1)
+        except ValueError:
+            element, value = value, ''
+        raw_value += _from_group(element, empty)
+    return raw_value
+
+
 class LogicalName(cdt.OctetString, size=6):
     """ Logical Name type. Default is CLock#1 """
     __match_args__ = ('a', 'b', 'c', 'd', 'e', 'f')
@@ -10,36 +34,7 @@ class LogicalName(cdt.OctetString, size=6):
 
     def from_str(self, value: str) -> bytes:
         """ create logical_name: octet_string from string type ddd.ddd.ddd.ddd.ddd.ddd, ex.: 0.0.1.0.0.255 """
-        raw_value = bytes()
-        for typecast, separator in zip((self.__from_group_A, )*5+(self.__from_group_F, ), ('.', '.', '.', '.', '.', ' ')):
-            try:
-                element, value = value.split(separator, 1)
-            except ValueError:
-                element, value = value, ''
-            raw_value += typecast(element)
-        return raw_value
-
-    def __from_group_A(self, value: str) -> bytes:
-        if isinstance(value, str):
-            if value == '':
-                return b'\x00'
-            try:
-                return int(value).to_bytes(1, 'big')
-            except OverflowError:
-                raise ValueError(F'Int too big to convert {value}')
-        else:
-            raise TypeError(F'Unsupported type validation from string, got {value.__class__}')
-
-    def __from_group_F(self, value: str) -> bytes:
-        if isinstance(value, str):
-            if value == '':
-                return b'\xff'
-            try:
-                return int(value).to_bytes(1, 'big')
-            except OverflowError:
-                raise ValueError(F'Int too big to convert {value}')
-        else:
-            raise TypeError(F'Unsupported type validation from string, got {value.__class__}')
+        return _ln_contents_from_str(value)
 
     def __str__(self):
         return '.'.join(map(str, self.contents))
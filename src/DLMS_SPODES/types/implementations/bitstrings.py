@@ -52,22 +52,12 @@ class Conformance(cdt.BitString):
             case _ as error:                            raise TypeError(F'Expected {self.NAME} type, got {cdt.get_common_data_type_from(error).NAME}')
 
     def from_str(self, value: str) -> bytes:
-        value = value + '0' * ((8 - len(self)) % 8)
-        list_ = [value[count:(count + 8)] for count in range(0, len(self), 8)]
-        value = b''
-        for byte in list_:
-            value += int(byte, base=2).to_bytes(1, byteorder='little')
-        return value
+        return cdt.pack_bits(value.ljust(len(self), '0')[:len(self)])
 
     def from_int(self, value: int) -> bytes:
         if value < 0:
             raise ValueError
-        res = 0
-        start_bit = 2 ** (len(self) - 1)
-        for i in range(len(self)):
-            if value & (1 << i):
-                res += start_bit >> i
-        return res.to_bytes(len(self) // 8, byteorder='big')
+        return cdt.pack_bits(format(value & ((1 << len(self)) - 1), F'0{len(self)}b')[::-1])
 
     def from_bytearray(self, value: bytearray) -> bytes:
         return bytes(value)
@@ -526,10 +526,7 @@ class BitString(UT):
 
     @property
     def contents(self) -> bytes:
-        a = "".join(map(str, self.value))
-        value = a + '0' * ((8 - len(self.value)) % 8)
-        x = bytes((int(value[count:(count + 8)], base=2) for count in range(0, len(self.value), 8)))
-        return encode_length(len(self)) + x
+        return encode_length(len(self)) + cdt.pack_bits("".join(map(str, self.value)))
 
     @classmethod
     def from_contents(cls, value: bytes) -> Self:
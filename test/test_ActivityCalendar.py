@@ -5,6 +5,10 @@ from src.DLMS_SPODES.version import AppVersion
 from src.DLMS_SPODES.cosem_interface_classes.overview import Version
 from src.DLMS_SPODES import exceptions as exc
 
+_DAY_PROFILE_TABLE = bytes.fromhex("01 01 02 02 11 00 01 01 02 03 09 04 00 00 ff ff 09 06 00 00 0a 00 64 ff 12 00 01")
+_WEEK_PROFILE_TABLE = bytes.fromhex("01 01 02 08 09 07 44 65 66 61 75 6c 74 11 01 11 00 11 00 11 00 11 00 11 00 11 00")
+_SEASON_PROFILE = bytes.fromhex("01 01 02 03 09 07 44 65 66 61 75 6c 74 09 0c ff ff 01 01 ff ff ff ff ff 80 00 00 09 07 44 65 66 61 75 6c 73")
+
 
 class TestType(unittest.TestCase):
 
@@ -33,11 +37,11 @@ class TestType(unittest.TestCase):
 
     def test_ActivityCalendar(self):
         obj: collection.ActivityCalendar = collection.ActivityCalendar("0.0.13.0.0.255")
-        obj.day_profile_table_active.set(bytes.fromhex("01 01 02 02 11 00 01 01 02 03 09 04 00 00 ff ff 09 06 00 00 0a 00 64 ff 12 00 01"))
+        obj.day_profile_table_active.set(_DAY_PROFILE_TABLE)
         obj.day_profile_table_active.append((1, [("00:00", "1.2.3.4.5.6", 1)]))
-        obj.week_profile_table_active.set(bytes.fromhex("01 01 02 08 09 07 44 65 66 61 75 6c 74 11 01 11 00 11 00 11 00 11 00 11 00 11 00"))
+        obj.week_profile_table_active.set(_WEEK_PROFILE_TABLE)
         obj.week_profile_table_active.append()
         # obj.week_profile_table_active.append((bytearray(b'\x00'), 0, 0, 0, 0, 0, 0, 0))
-        obj.season_profile_active.set(bytes.fromhex("01 01 02 03 09 07 44 65 66 61 75 6c 74 09 0c ff ff 01 01 ff ff ff ff ff 80 00 00 09 07 44 65 66 61 75 6c 73"))
+        obj.season_profile_active.set(_SEASON_PROFILE)
         obj.season_profile_active.append()
         obj.validate()
@@ -5,6 +5,10 @@ from src.DLMS_SPODES.version import AppVersion
 from src.DLMS_SPODES.cosem_interface_classes.overview import Version
 from src.DLMS_SPODES import exceptions as exc
 
+_TEMPERATURE = bytes.fromhex('10 00 1b')
+_THRESHOLD_ACTIVE = bytes.fromhex('11 00 00 00 00')
+_MONITORED_VALUE = bytes.fromhex('02 03 12 00 03 09 06 00 00 60 09 00 ff 0f 02')
+
 
 class TestType(unittest.TestCase):
 
@@ -16,11 +20,11 @@ class TestType(unittest.TestCase):
         tem = col.add(class_id=classID.REGISTER,
                 version=Version.V0,
                 logical_name=cst.LogicalName("0.0.96.9.0.255"))
-        tem.set_attr(2, bytes.fromhex('10 00 1b'))
+        tem.set_attr(2, _TEMPERATURE)
         lim = col.add(class_id=classID.LIMITER,
                 version=Version.V0,
                 logical_name=cst.LogicalName("0.0.17.0.5.255"))
         # lim.set_attr(3, bytes.fromhex('11 00 00 00 00'))
-        self.assertRaises(exc.EmptyObj, lim.set_attr, 3, bytes.fromhex('11 00 00 00 00'))
-        lim.set_attr(2, bytes.fromhex('02 03 12 00 03 09 06 00 00 60 09 00 ff 0f 02'))
+        self.assertRaises(exc.EmptyObj, lim.set_attr, 3, _THRESHOLD_ACTIVE)
+        lim.set_attr(2, _MONITORED_VALUE)
         print(col, lim)
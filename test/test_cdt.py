@@ -1,29 +1,92 @@
 import datetime
 import unittest
+import logging
 import inspect
-from itertools import count
+from typing import Iterator
 from src.DLMS_SPODES.types.common_data_types import encode_length
 from src.DLMS_SPODES.types.cosemClassID import CosemClassId
 from src.DLMS_SPODES.cosem_interface_classes import ic, collection
 from src.DLMS_SPODES.types import cdt, cst, ut, implementations as impl, choices
 from src.DLMS_SPODES import relation_to_OBIS, enums
 from src.DLMS_SPODES.cosem_interface_classes.collection import Collection
+from src.DLMS_SPODES.cosem_interface_classes.gprs_modem_setup import QualityOfService  # for search in _ALL_CDT
+from src.DLMS_SPODES.cosem_interface_classes.association_ln.ver0 import XDLMSContextType
+from src.DLMS_SPODES.cosem_interface_classes.association_ln.ver1 import ObjectListElement
+from src.DLMS_SPODES.cosem_interface_classes.association_ln import mechanism_id
+from src.DLMS_SPODES.cosem_interface_classes.push_setup.ver2 import RestrictionElement
+from src.DLMS_SPODES.cosem_interface_classes.security_setup.ver1 import SecurityPolicyVer1
+from src.DLMS_SPODES.types.implementations import structs
+
+logger = logging.getLogger(__name__)
+
+
+def _walk_subclasses(t: type) -> Iterator[type]:
+    yield t
+    for sub in t.__subclasses__():
+        yield from _walk_subclasses(sub)
+
+
+_ALL_CDT = tuple(_walk_subclasses(cdt.CommonDataType))
+_VALID_TYPES = frozenset(_ALL_CDT)
+"""known CDT classes, subclasses created after import are checked by issubclass"""
+_IS_CONCRETE = {t: not inspect.isabstract(t) and t not in (cdt.Structure, cdt.Enum) for t in _ALL_CDT}
+
+_PG_ATTR3_ENC = b'\x01\x05\x02\x04\x12\x00\x08\x09\x06\x00\x00\x01\x00\x00\xff\x0f\x02\x12\x00\x00\x02\x04\x12\x00\x03\x09\x06\x01\x00\x02\x1d\x00\xff\x0f\x03\x12\x00\x00\x02\x04\x12\x00\x03\x09\x06\x01\x00\x01\x1d\x00\xff\x0f\x03\x12\x00\x00\x02\x04\x12\x00\x03\x09\x06\x01\x00\x03\x1d\x00\xff\x0f\x03\x12\x00\x00\x02\x04\x12\x00\x03\x09\x06\x01\x00\x04\x1d\x00\xff\x0f\x03\x12\x00\x00'
+_PG_ATTR2_ENC = b'\x01\x01\x02\x05\x09\x0c\x07\x6e\x08\x1f\x07\x00\x00\xff\xff\x80\x00\x00\x02\x02\x0f\xfd\x16\x1e\x02\x02\x0f\xfd\x16\x1e\x02\x02\x0f\xfd\x16\x20\x02\x02\x0f\xfd\x16\x20'
+_STRUCT_ENC = b'\x02\x04\x12\x00\x0f\x11\x01\t\x06\x00\x00(\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x04\x02\x02\x0f\x01\x16\x00\x02\x02\x0f\x02\x16\x00\x02\x02\x0f\x03\x16\x00\x02\x02\x0f\x04\x16\x00\x02\x04\x12\x00\x08\x11\x00\t\x06\x00\x00\x01\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x06\x02\x02\x0f\x01\x16\x00\x02\x02\x0f\x02\x16\x00\x02\x02\x0f\x03\x16\x00\x02\x02\x0f\x04\x16\x00\x02\x02\x0f\x05\x16\x00\x02\x02\x0f\x06\x16\x00\x02\x04\x12\x00\x08\x11\x00\t\x06\x00\x03\x01\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x06\x02\x02\x0f\x01\x16\x00\x02\x02\x0f\x02\x16\x00\x02\x02\x0f\x03\x16\x00\x02\x02\x0f\x04\x16\x00\x02\x02\x0f\x05\x16\x00\x02\x02\x0f\x06\x16\x00\x02\x04\x12\x00\x0f\x11\x01\t\x06\x00\x00(\x00\x01\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x04\x02\x02\x0f\x01\x16\x00\x02\x02\x0f\x02\x16\x00\x02\x02\x0f\x03\x16\x00\x02\x02\x0f\x04\x16\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00*\x00\x00\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x00\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x01\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x02\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x03\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x04\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x06\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x07\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x08\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\n\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00\x00\x02\x00\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00\x00\x02\x01\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00\x00\x02\x08\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x02\x00\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x02\x08\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x03\x03\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x03\x04\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x04\x02\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x04\x03\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x08\x04\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x08\x05\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x17\x11\x01\t\x06\x00\x00\x16\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x00\x02\x04\x12\x00\x17\x11\x01\t\x06\x00\x01\x16\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x00\x02\x04\x12\x00\x17\x11\x01\t\x06\x00\x02\x16\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x00\x02\x04\x12\x00\x17\x11\x01\t\x06\x00\x03\x16\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x0c\x04\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x80`\x0c\x00\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00'
+_RE_ENC_DATE = b'\x02\x02\x16\x01\x02\x02\t\x05\x07\xd0\x01\x01\xff\t\x05\x07\xd0\x01\x02\xff'
+_RE_ENC_ENTRY = b'\x02\x02\x16\x02\x02\x02\x06\x00\x00\x00\x01\x06\x00\x01\x86\xa0'
+_RE_ENC_NONE = b'\x02\x02\x16\x00\x00'
+_RE_ENCODE_CASES = (
+    ((0, None), _RE_ENC_NONE, "init by None"),
+    ((1, ("01.01.2000", "02.01.2000")), _RE_ENC_DATE, "init by DateRestriction"),
+    ((2, (1, 100000)), _RE_ENC_ENTRY, "init by EntryRestriction"),
+    (_RE_ENC_DATE, _RE_ENC_DATE, "init from bytes by DateRestriction"),
+)
+_RE_DECODE_CASES = (
+    (_RE_ENC_NONE, (0, None), "init from bytes by None"),
+    (_RE_ENC_ENTRY, (2, (1, 100000)), "init from bytes by EntryRestriction"),
+)
 
 
 class TestType(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        """read only collection with Image Transfer, build once for all tests"""
+        cls.collection = col = Collection()
+        col.add(class_id=CosemClassId(18), version=cdt.Unsigned(0), logical_name=cst.LogicalName('0.0.44.0.0.255'))
+
+    @staticmethod
+    def get_profile_collection() -> tuple[Collection, collection.ProfileGenericVer1]:
+        """new collection with Profile Generic and its capture objects, for tests changing them"""
+        col = Collection()
+        col.add(class_id=CosemClassId(15), version=cdt.Unsigned(1), logical_name=cst.LogicalName('0.0.40.0.0.255'))
+        col.add(class_id=CosemClassId(8), version=cdt.Unsigned(0), logical_name=cst.LogicalName('0.0.1.0.0.255'))
+        col.add(class_id=CosemClassId(3), version=cdt.Unsigned(0), logical_name=cst.LogicalName('1.0.2.29.0.255'))
+        col.add(class_id=CosemClassId(3), version=cdt.Unsigned(0), logical_name=cst.LogicalName('1.0.1.29.0.255'))
+        col.add(class_id=CosemClassId(3), version=cdt.Unsigned(0), logical_name=cst.LogicalName('1.0.3.29.0.255'))
+        col.add(class_id=CosemClassId(3), version=cdt.Unsigned(0), logical_name=cst.LogicalName('1.0.4.29.0.255'))
+        profile = col.add(class_id=ut.CosemClassId(7), version=cdt.Unsigned(1), logical_name=cst.LogicalName('1.0.94.7.4.255'))
+        profile.collection = col
+        return col, profile
+
     def test_TAG(self):
         value = cdt.TAG(b'\x01')
-        print(value)
+        logger.debug("%s", value)
 
     def test_encode_length(self):
-        self.assertEqual(encode_length(1), b'\x01')
-        self.assertEqual(encode_length(0x7e), b'\x7e')
-        self.assertEqual(encode_length(0x80), b'\x81\x80')
-        self.assertEqual(encode_length(0xff), b'\x81\xff')
-        self.assertEqual(encode_length(0x100), b'\x82\x01\x00')
-        self.assertEqual(encode_length(0x1000), b'\x82\x10\x00')
-        self.assertEqual(encode_length(0x10000), b'\x84\x00\x01\x00\x00')
-        self.assertEqual(encode_length(0xffffffff), b'\x84\xff\xff\xff\xff')
+        for length, expected in (
+            (1, b'\x01'),
+            (0x7e, b'\x7e'),
+            (0x80, b'\x81\x80'),
+            (0xff, b'\x81\xff'),
+            (0x100, b'\x82\x01\x00'),
+            (0x1000, b'\x82\x10\x00'),
+            (0x10000, b'\x84\x00\x01\x00\x00'),
+            (0xffffffff, b'\x84\xff\xff\xff\xff'),
+        ):
+            with self.subTest(length=length):
+                self.assertEqual(encode_length(length), expected)
 
     def test_exist_attr(self):
         """ Existing attribute 'class_name' in each DLMS class """
@@ -41,7 +104,14 @@ class TestType(unittest.TestCase):
         self.assertEqual(a.decode(), [1, 0, 1, 0, 1, 1], 'decode to list')
         a.set("1010101010101")
         a.set([1, 0, 1])
-        print(a)
+        logger.debug("%s", a)
+        a = cdt.BitString(b'\x04\x0a\xff\xff')
+        self.assertEqual(a.popcount(), 10, 'padding bits not counted')
+        self.assertTrue(a.all())
+        a.set('0010')
+        self.assertEqual(a.popcount(), 1)
+        self.assertTrue(a.any())
+        self.assertFalse(a.all())
 
     def test_DateTime(self):
         pattern = datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc)
@@ -50,24 +120,14 @@ class TestType(unittest.TestCase):
     def test_UnitScaler(self):
         value = cdt.ScalUnitType()
         value.set((10, 10))
-        print(value)
+        logger.debug("%s", value)
 
     def test_ProfileGeneric(self):
-        from src.DLMS_SPODES.cosem_interface_classes.association_ln.ver1 import ObjectListElement
-        from src.DLMS_SPODES.types.implementations import structs
-        col = Collection()
-        col.add(class_id=CosemClassId(15), version=cdt.Unsigned(1), logical_name=cst.LogicalName('0.0.40.0.0.255'))
-        col.add(class_id=CosemClassId(8), version=cdt.Unsigned(0), logical_name=cst.LogicalName('0.0.1.0.0.255'))
-        col.add(class_id=CosemClassId(3), version=cdt.Unsigned(0), logical_name=cst.LogicalName('1.0.2.29.0.255'))
-        col.add(class_id=CosemClassId(3), version=cdt.Unsigned(0), logical_name=cst.LogicalName('1.0.1.29.0.255'))
-        col.add(class_id=CosemClassId(3), version=cdt.Unsigned(0), logical_name=cst.LogicalName('1.0.3.29.0.255'))
-        col.add(class_id=CosemClassId(3), version=cdt.Unsigned(0), logical_name=cst.LogicalName('1.0.4.29.0.255'))
-        profile = col.add(class_id=ut.CosemClassId(7), version=cdt.Unsigned(1), logical_name=cst.LogicalName('1.0.94.7.4.255'))
-        profile.collection = col
+        col, profile = self.get_profile_collection()
         profile.set_attr(6, structs.CaptureObjectDefinition().encoding)
-        profile.set_attr(3, bytes.fromhex('01 05 02 04 12 00 08 09 06 00 00 01 00 00 ff 0f 02 12 00 00 02 04 12 00 03 09 06 01 00 02 1d 00 ff 0f 03 12 00 00 02 04 12 00 03 09 06 01 00 01 1d 00 ff 0f 03 12 00 00 02 04 12 00 03 09 06 01 00 03 1d 00 ff 0f 03 12 00 00 02 04 12 00 03 09 06 01 00 04 1d 00 ff 0f 03 12 00 00'))
+        profile.set_attr(3, _PG_ATTR3_ENC)
         profile.buffer.selective_access.access_selector.set_contents_from(2)
-        profile.set_attr(2, bytes.fromhex('01 01 02 05 09 0c 07 6e 08 1f 07 00 00 ff ff 80 00 00 02 02 0f fd 16 1e 02 02 0f fd 16 1e 02 02 0f fd 16 20 02 02 0f fd 16 20'))
+        profile.set_attr(2, _PG_ATTR2_ENC)
         a = ObjectListElement((3, 0, '1.0.1.29.0.255', None))
         b = col.get_object(a)
         b1 = col.get_object(structs.CaptureObjectDefinition((3, '1.0.1.29.0.255', None, None)))
@@ -83,40 +143,41 @@ class TestType(unittest.TestCase):
 
     def test_Association(self):
         ass = collection.AssociationLNVer0('0.0.40.0.1.255')
-        print(ass)
+        logger.debug("%s", ass)
 
     def test_Conformance(self):
-        from src.DLMS_SPODES.types.implementations.bitstrings import Conformance
-        from src.DLMS_SPODES.cosem_interface_classes.association_ln.ver0 import XDLMSContextType
-        c = Conformance()
-        print(c)
+        c = impl.bitstrings.Conformance()
+        logger.debug("%s", c)
         a = int('1011011101111', 2)
         c.set(a)
         self.assertEqual(c.decode(), [1, 1, 1, 1, 0, 1, 1, 1, 0, 1, 1, 0, 1, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0])
         context = XDLMSContextType()
-        c2 = Conformance()
+        c2 = impl.bitstrings.Conformance()
         self.assertEqual(c, c2, "equal")
-        print(context)
+        logger.debug("%s", context)
 
     def test_Conformance2(self):
-        from src.DLMS_SPODES.enums import Conformance
-        c = Conformance(431)
-        print(c.content, c.name, list(c))
+        c = enums.Conformance(431)
+        logger.debug("%s %s %s", c.content, c.name, list(c))
 
     def test_Conformance3(self):
-        from src.DLMS_SPODES.types.implementations.bitstrings import Conformance
-        c = Conformance()
-        print(c)
+        c = impl.bitstrings.Conformance()
+        logger.debug("%s", c)
+        self.assertEqual(impl.bitstrings.Conformance('1').contents, b'\x80\x00\x00', "short string padding by zeros from right")
+
+    def test_FlagMixin(self):
+        self.assertEqual(SecurityPolicyVer1('1').contents, b'\x01', "short string padding by zeros from left")
+        self.assertEqual(SecurityPolicyVer1('10000000').contents, b'\x80', "full string")
 
     def test_ImageTransfer(self):
-        col = Collection()
-        col.add(class_id=CosemClassId(18), version=cdt.Unsigned(0), logical_name=cst.LogicalName('0.0.44.0.0.255'))
-        print(col)
+        obj = self.collection.get_object(cst.LogicalName('0.0.44.0.0.255'))
+        self.assertEqual(obj.CLASS_ID, CosemClassId(18), "check Image Transfer added")
+        self.assertEqual(obj.logical_name.contents, b'\x00\x00\x2c\x00\x00\xff', "check logical name")
 
     def test_UTF8(self):
         value = cdt.Utf8String()
         value.set('ООО "Курганский приборостроительный завод"')
-        print(value)
+        logger.debug("%s", value)
 
     def test_Duration(self):
         value = impl.double_long_usingneds.DoubleLongUnsignedSecond()
@@ -128,7 +189,7 @@ class TestType(unittest.TestCase):
         value.unit.set(enums.Unit.CURRENT_AMPERE)
         a = str(value.unit)
         a = str(value.unit)
-        print(value.unit == cdt.Unit(enums.Unit.CURRENT_AMPERE))
+        logger.debug("%s", value.unit == cdt.Unit(enums.Unit.CURRENT_AMPERE))
 
     def test_Array(self):
         obj = collection.Data("1.1.1.1.1.1")
@@ -145,7 +206,7 @@ class TestType(unittest.TestCase):
         obj.set_attr(2, [4, 5, 6])
         self.assertEqual(value.encoding, b'\x01\x03\x11\x04\x11\x05\x11\x06', "check set build-in")
         a = obj.value.get_copy([1, 3])
-        print(a)
+        logger.debug("%s", a)
 
     def test_get_copy(self):
         value = cdt.Unsigned(3)
@@ -155,77 +216,78 @@ class TestType(unittest.TestCase):
     def test_Enum(self):
         value = cdt.Unit(4)
         match value:
-            case cdt.Unit(4): print("ok")
+            case cdt.Unit(4): logger.debug("ok")
 
     def test_integers(self):
         value = impl.integers.Only0(0)
-        print(value)
+        logger.debug("%s", value)
 
     def test_Structs(self):
+        choice_base = choices.CommonDataTypeChoiceBase
         for s in cdt.Structure.__subclasses__():
-            print(s)
+            logger.debug("%s", s)
             self.assertIsInstance(s.NAME, str, "check name")
-            for el in s.ELEMENTS:
-                self.assertIsInstance(el.NAME, str, "check element type name")
-                self.assertTrue(isinstance(el.TYPE, choices.CommonDataTypeChoiceBase) or issubclass(el.TYPE, cdt.CommonDataType), F"check element type is CDT: {s}.{el}")
+            bad_names = [el for el in s.ELEMENTS if not isinstance(el.NAME, str)]
+            self.assertFalse(bad_names, F"check element type name: {s}")
+            bad_types = [el for el in s.ELEMENTS if not (
+                el.TYPE in _VALID_TYPES or isinstance(el.TYPE, choice_base) or issubclass(el.TYPE, cdt.CommonDataType))]
+            self.assertFalse(bad_types, F"check element type is CDT: {s}")
 
     def test_RestrictionElement(self):
-        from src.DLMS_SPODES.cosem_interface_classes.push_setup.ver2 import RestrictionElement
-        self.assertEqual(RestrictionElement().encoding, b'\x02\x02\x16\x00\x00', "empty init")
-        self.assertEqual(RestrictionElement((0, None)).encoding, b'\x02\x02\x16\x00\x00', "init by None")
-        self.assertEqual(RestrictionElement((1, ("01.01.2000", "02.01.2000"))).encoding, b'\x02\x02\x16\x01\x02\x02\t\x05\x07\xd0\x01\x01\xff\t\x05\x07\xd0\x01\x02\xff', "init by DateRestriction")
-        self.assertEqual(RestrictionElement((2, (1, 100000))).encoding, b'\x02\x02\x16\x02\x02\x02\x06\x00\x00\x00\x01\x06\x00\x01\x86\xa0', "init by EntryRestriction")
-        self.assertEqual(RestrictionElement(b'\x02\x02\x16\x00\x00').decode(), (0, None), "init from bytes by None")
-        self.assertEqual(RestrictionElement(b'\x02\x02\x16\x01\x02\x02\t\x05\x07\xd0\x01\x01\xff\t\x05\x07\xd0\x01\x02\xff').encoding, b'\x02\x02\x16\x01\x02\x02\t\x05\x07\xd0\x01\x01\xff\t\x05\x07\xd0\x01\x02\xff', "init from bytes by DateRestriction")
-        self.assertEqual(RestrictionElement(b'\x02\x02\x16\x02\x02\x02\x06\x00\x00\x00\x01\x06\x00\x01\x86\xa0').decode(), (2, (1, 100000)), "init from bytes by EntryRestriction")
+        self.assertEqual(RestrictionElement().encoding, _RE_ENC_NONE, "empty init")
+        for value, expected, msg in _RE_ENCODE_CASES:
+            with self.subTest(msg):
+                self.assertEqual(RestrictionElement(value).encoding, expected, msg)
+        for value, expected, msg in _RE_DECODE_CASES:
+            with self.subTest(msg):
+                self.assertEqual(RestrictionElement(value).decode(), expected, msg)
         value = RestrictionElement()
         value.restriction_type.set(1)
-        print('ok')
+        logger.debug("ok")
 
     def test_cdt_type_name(self):
-        from src.DLMS_SPODES.cosem_interface_classes.push_setup.ver2 import RestrictionElement
         value = RestrictionElement()
-        print(cdt.get_type_name(value))
-        print(cdt.get_type_name(RestrictionElement))
+        logger.debug("%s", cdt.get_type_name(value))
+        logger.debug("%s", cdt.get_type_name(RestrictionElement))
         value = cdt.VisibleString("hello")
-        print(cdt.get_type_name(value))
+        logger.debug("%s", cdt.get_type_name(value))
         value = cst.LogicalName("1.1.1.1.1.255")
-        print(cdt.get_type_name(value))
+        logger.debug("%s", cdt.get_type_name(value))
         value = cdt.Unsigned(1)
-        print(cdt.get_type_name(value))
+        logger.debug("%s", cdt.get_type_name(value))
         value = impl.integers.Only0()
-        print(cdt.get_type_name(value))
-        print(cdt.get_type_name(value))
+        logger.debug("%s", cdt.get_type_name(value))
+        logger.debug("%s", cdt.get_type_name(value))
 
     def test_all_cdt(self):
-        from src.DLMS_SPODES.cosem_interface_classes.gprs_modem_setup import QualityOfService
-        c = [cdt.CommonDataType]
-        count1 = count()
-        while len(c) != 0:
-            t = c.pop()
-            c.extend(t.__subclasses__())
-            print(next(count1), t, t.TAG, F"{cdt.get_type_name(t)} {t.TAG}" if (not inspect.isabstract(t) and t != cdt.Structure and t != cdt.Enum) else "abstract")
+        for i, t in enumerate(_ALL_CDT):
+            if _IS_CONCRETE[t]:
+                name = cdt.get_type_name(t)
+                self.assertIsInstance(name, str, F"check type name: {t}")
+                self.assertTrue(name, F"check type name not empty: {t}")
+            else:
+                name = "abstract"
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s %s %s %s", i, t, t.TAG, F"{name} {t.TAG}" if _IS_CONCRETE[t] else name)
 
     def test_Struct(self):
         # create nonename struct from AssociationLN.ObjectList data
-        encoding = b'\x02\x04\x12\x00\x0f\x11\x01\t\x06\x00\x00(\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x04\x02\x02\x0f\x01\x16\x00\x02\x02\x0f\x02\x16\x00\x02\x02\x0f\x03\x16\x00\x02\x02\x0f\x04\x16\x00\x02\x04\x12\x00\x08\x11\x00\t\x06\x00\x00\x01\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x06\x02\x02\x0f\x01\x16\x00\x02\x02\x0f\x02\x16\x00\x02\x02\x0f\x03\x16\x00\x02\x02\x0f\x04\x16\x00\x02\x02\x0f\x05\x16\x00\x02\x02\x0f\x06\x16\x00\x02\x04\x12\x00\x08\x11\x00\t\x06\x00\x03\x01\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x06\x02\x02\x0f\x01\x16\x00\x02\x02\x0f\x02\x16\x00\x02\x02\x0f\x03\x16\x00\x02\x02\x0f\x04\x16\x00\x02\x02\x0f\x05\x16\x00\x02\x02\x0f\x06\x16\x00\x02\x04\x12\x00\x0f\x11\x01\t\x06\x00\x00(\x00\x01\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x04\x02\x02\x0f\x01\x16\x00\x02\x02\x0f\x02\x16\x00\x02\x02\x0f\x03\x16\x00\x02\x02\x0f\x04\x16\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00*\x00\x00\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x00\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x01\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x02\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x03\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x04\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x06\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x07\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\x08\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x01\n\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00\x00\x02\x00\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00\x00\x02\x01\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00\x00\x02\x08\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x02\x00\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x02\x08\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x03\x03\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x03\x04\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x04\x02\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x04\x03\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x08\x04\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x01\x00\x00\x08\x05\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x17\x11\x01\t\x06\x00\x00\x16\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x00\x02\x04\x12\x00\x17\x11\x01\t\x06\x00\x01\x16\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x00\x02\x04\x12\x00\x17\x11\x01\t\x06\x00\x02\x16\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x00\x02\x04\x12\x00\x17\x11\x01\t\x06\x00\x03\x16\x00\x00\xff\x02\x02\x01\t\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x02\x03\x0f\x03\x16\x01\x00\x02\x03\x0f\x04\x16\x01\x00\x02\x03\x0f\x05\x16\x01\x00\x02\x03\x0f\x06\x16\x01\x00\x02\x03\x0f\x07\x16\x01\x00\x02\x03\x0f\x08\x16\x01\x00\x02\x03\x0f\t\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x00`\x0c\x04\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00\x02\x04\x12\x00\x01\x11\x00\t\x06\x00\x80`\x0c\x00\xff\x02\x02\x01\x02\x02\x03\x0f\x01\x16\x01\x00\x02\x03\x0f\x02\x16\x01\x00\x01\x00'
-        value = cdt.Structure(encoding)
-        print(value, value.decode())
+        value = cdt.Structure(_STRUCT_ENC)
+        logger.debug("%s %s", value, value.decode())
 
     def test_Boolean(self):
         value = cdt.Boolean(1)
         self.assertEqual(int(value), 1, "check value decode")
         value2 = cdt.Boolean(b"\x03\x00")
-        print(value2)
+        logger.debug("%s", value2)
 
     def test_mechanism_id(self):
-        from src.DLMS_SPODES.cosem_interface_classes.association_ln import mechanism_id
         value = mechanism_id.MechanismIdElement(0)
         value.set(1)
-        print(value)
+        logger.debug("%s", value)
         value2 = mechanism_id.NONE
         value2.set(1)
-        print(value2)
+        logger.debug("%s", value2)
 
     def test_LN_sort(self):
         l = [
@@ -234,4 +296,4 @@ class TestType(unittest.TestCase):
             cst.LogicalName("0.0.1.0.1.255"),
         ]
         l2 = sorted(l)
-        print(l2)
\ No newline at end of file
+        logger.debug("%s", l2)
\ No newline at end of file